@@ -2,6 +2,34 @@
 AutoBolt: An automated bolt selection and analysis tool.
 """
 
-from .combined import calculate_fos
-from .fea_solver import _calculate_fos_from_build123d
-from .parametric_cad_solver import create_two_plate_assembly
+import importlib
+from typing import TYPE_CHECKING
+
+# Public names are resolved lazily (PEP 562) so that `import autobolt` stays
+# cheap; build123d, dolfinx and gmsh are only loaded when actually used.
+_LAZY_ATTRIBUTES = {
+    "calculate_fos": ".combined",
+    "calculate_fos_batch": ".combined",
+    "calculate_fos_sweep": ".combined",
+    "BoltAssemblyFEA": ".fea_solver",
+    "_calculate_fos_from_build123d": ".fea_solver",
+    "create_two_plate_assembly": ".parametric_cad_solver",
+}
+
+__all__ = [name for name in _LAZY_ATTRIBUTES if not name.startswith("_")]
+
+if TYPE_CHECKING:
+    from .combined import calculate_fos, calculate_fos_batch, calculate_fos_sweep
+    from .fea_solver import BoltAssemblyFEA, _calculate_fos_from_build123d
+    from .parametric_cad_solver import create_two_plate_assembly
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
@@ -1,7 +1,36 @@
-from .fea_solver import _calculate_fos_from_build123d
+import concurrent.futures
+import contextlib
+import functools
+import multiprocessing
+import os
+
+from .fea_solver import BoltAssemblyFEA
 from .parametric_cad_solver import create_two_plate_assembly
 
 
+@functools.lru_cache(maxsize=32)
+def _cached_two_plate_assembly(*geometry: float):
+    """
+    Memoized wrapper around create_two_plate_assembly.
+
+    The key is the tuple of geometric parameters as produced by
+    _geometry_key, so repeated calls with the same geometry (e.g. material
+    or load sweeps) reuse the assembly instead of redoing the CSG booleans.
+    """
+    return create_two_plate_assembly(*geometry)
+
+
+def _geometry_key(*geometry: float) -> tuple:
+    """
+    Round float geometry parameters to 1e-9 so that values which differ only
+    by floating-point noise map to the same cache entry.
+    """
+    return tuple(
+        value if isinstance(value, int) else round(float(value), 9)
+        for value in geometry
+    )
+
+
 def calculate_fos(
     plate_length_m: float,
     plate_width_m: float,
@@ -16,6 +45,12 @@ def calculate_fos(
     poissons_ratio: float,
     yield_strength: float,
     traction_values: list[tuple],
+    element_order: int = 1,
+    mesh_size: float | None = None,
+    hole_mesh_size: float | None = None,
+    solver_tolerance: float = 1e-6,
+    debug_output: bool = False,
+    debug_dir: str | None = None,
 ) -> float:
     """
     Calculate the Factor of Safety (FOS) for a two-plate assembly with bolt holes.
@@ -34,12 +69,19 @@ def calculate_fos(
         poissons_ratio (float): Poisson's ratio of the material.
         yield_strength (float): Yield strength of the material.
         traction_values (list[tuple]): List of traction force vectors to apply on specified surfaces.
+        element_order (int): Polynomial order of the Lagrange elements (1 or 2).
+        mesh_size (float, optional): Target element size in meters over the whole model.
+        hole_mesh_size (float, optional): Target element size in meters on the hole and bolt surfaces.
+            Defaults to hole_radius_m / 8.
+        solver_tolerance (float): Relative residual tolerance of the iterative solver.
+        debug_output (bool): Write displacement.pvd and stress.pvd to a new temporary directory.
+        debug_dir (str, optional): Directory for the debug output; implies debug_output.
 
     Returns:
         float: The calculated Factor of Safety (FOS).
     """
-    # Create the two-plate assembly
-    assembly = create_two_plate_assembly(
+    # A single load case is a sweep of length one
+    fos = calculate_fos_sweep(
         plate_length_m,
         plate_width_m,
         plate_thickness_m,
@@ -49,16 +91,190 @@ def calculate_fos(
         hole_spacing_m,
         hole_offset_from_bottom_m,
         plate_gap_mm,
+        elastic_modulus,
+        poissons_ratio,
+        yield_strength,
+        traction_cases=[traction_values],
+        element_order=element_order,
+        mesh_size=mesh_size,
+        hole_mesh_size=hole_mesh_size,
+        solver_tolerance=solver_tolerance,
+        debug_output=debug_output,
+        debug_dir=debug_dir,
+    )[0]
+
+    # Return the factor of safety
+    return fos
+
+
+def calculate_fos_sweep(
+    plate_length_m: float,
+    plate_width_m: float,
+    plate_thickness_m: float,
+    num_holes: int,
+    hole_radius_m: float,
+    edge_margin_m: float,
+    hole_spacing_m: float,
+    hole_offset_from_bottom_m: float,
+    plate_gap_mm: float,
+    elastic_modulus: float,
+    poissons_ratio: float,
+    yield_strength: float,
+    traction_cases: list[list[tuple]],
+    element_order: int = 1,
+    mesh_size: float | None = None,
+    hole_mesh_size: float | None = None,
+    solver_tolerance: float = 1e-6,
+    debug_output: bool = False,
+    debug_dir: str | None = None,
+) -> list[float]:
+    """
+    Calculate the Factor of Safety (FOS) of a two-plate assembly for several load cases.
+
+    The assembly is meshed and the stiffness matrix is assembled once; each
+    load case only reassembles the load vector and reuses the solver.
+
+    Parameters:
+        plate_length_m (float): Length of the plates in meters.
+        plate_width_m (float): Width of the plates in meters.
+        plate_thickness_m (float): Thickness of the plates in meters.
+        num_holes (int): Number of bolt holes.
+        hole_radius_m (float): Radius of each bolt hole in meters.
+        edge_margin_m (float): Margin from the edge to the first hole in meters.
+        hole_spacing_m (float): Spacing between the centers of adjacent holes in meters.
+        hole_offset_from_bottom_m (float): Offset of the holes from the bottom edge in meters
+        plate_gap_mm (float): Gap between the two plates in millimeters.
+        elastic_modulus (float): Young's modulus of the material.
+        poissons_ratio (float): Poisson's ratio of the material.
+        yield_strength (float): Yield strength of the material.
+        traction_cases (list[list[tuple]]): One list of traction force vectors per load case.
+        element_order (int): Polynomial order of the Lagrange elements (1 or 2).
+        mesh_size (float, optional): Target element size in meters over the whole model.
+        hole_mesh_size (float, optional): Target element size in meters on the hole and bolt surfaces.
+            Defaults to hole_radius_m / 8.
+        solver_tolerance (float): Relative residual tolerance of the iterative solver.
+        debug_output (bool): Write displacement.pvd and stress.pvd to a new temporary directory.
+        debug_dir (str, optional): Directory for the debug output; implies debug_output.
+
+    Returns:
+        list[float]: The calculated Factor of Safety (FOS) for each load case.
+    """
+    # Create the two-plate assembly (cached on the geometric parameters)
+    assembly = _cached_two_plate_assembly(
+        *_geometry_key(
+            plate_length_m,
+            plate_width_m,
+            plate_thickness_m,
+            num_holes,
+            hole_radius_m,
+            edge_margin_m,
+            hole_spacing_m,
+            hole_offset_from_bottom_m,
+            plate_gap_mm,
+        )
     )
 
-    # Calculate the factor of safety
-    fos = _calculate_fos_from_build123d(
-        build123d_object=assembly,
+    # Mesh and assemble the stiffness matrix once
+    with BoltAssemblyFEA(
+        assembly,
         elastic_modulus=elastic_modulus,
         poissons_ratio=poissons_ratio,
         yield_strength=yield_strength,
-        traction_values=traction_values,
-    )
+        element_order=element_order,
+        mesh_size=mesh_size,
+        hole_mesh_size=hole_mesh_size,
+        solver_tolerance=solver_tolerance,
+        debug_output=debug_output,
+        debug_dir=debug_dir,
+    ) as fea:
+        # Solve each load case against the same operator
+        return [fea.solve(traction_values) for traction_values in traction_cases]
 
-    # Return the factor of safety
-    return fos
+
+# Threading knobs of the numerical libraries used in the workers. Each batch
+# worker is single-threaded so that N workers do not oversubscribe the cores.
+_SINGLE_THREAD_ENV = {
+    "OMP_NUM_THREADS": "1",
+    "OPENBLAS_NUM_THREADS": "1",
+    "MKL_NUM_THREADS": "1",
+}
+
+
+@contextlib.contextmanager
+def _single_threaded_env():
+    """
+    Temporarily set _SINGLE_THREAD_ENV so that spawned workers inherit it
+    before they import any numerical library.
+    """
+    saved = {name: os.environ.get(name) for name in _SINGLE_THREAD_ENV}
+    os.environ.update(_SINGLE_THREAD_ENV)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def _init_batch_worker(worker_counter):
+    """
+    Pin each batch worker to its own core (where the OS supports it).
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    with worker_counter.get_lock():
+        index = worker_counter.value
+        worker_counter.value += 1
+    cores = sorted(os.sched_getaffinity(0))
+    os.sched_setaffinity(0, {cores[index % len(cores)]})
+
+
+def _calculate_fos_from_config(config: dict) -> float:
+    """
+    Run calculate_fos on one configuration dict (picklable batch worker entry point).
+    """
+    return calculate_fos(**config)
+
+
+def calculate_fos_batch(
+    configs: list[dict],
+    n_workers: int | None = None,
+) -> list[float]:
+    """
+    Calculate the Factor of Safety (FOS) for several independent configurations in parallel.
+
+    Each configuration is solved in a separate process, since FEniCS and OCCT
+    are not thread-safe.
+
+    Workers are started with the "spawn" method on every OS, which re-imports
+    the calling script in each worker. Scripts must therefore call this from
+    under an ``if __name__ == "__main__":`` guard, or worker start-up fails.
+    While the pool runs, OMP_NUM_THREADS, OPENBLAS_NUM_THREADS and
+    MKL_NUM_THREADS are set to 1 in os.environ for the whole process (so that
+    workers inherit them) and restored afterwards.
+
+    Parameters:
+        configs (list[dict]): Keyword arguments for calculate_fos, one dict per configuration.
+        n_workers (int, optional): Number of worker processes. Defaults to half the CPU count.
+
+    Returns:
+        list[float]: The calculated Factor of Safety (FOS) for each configuration, in order.
+    """
+    if n_workers is None:
+        n_workers = max(1, (os.cpu_count() or 2) // 2)
+
+    # Spawn (rather than fork) so workers start without the parent's
+    # FEniCS/gmsh state and pick up the single-threaded environment
+    ctx = multiprocessing.get_context("spawn")
+    worker_counter = ctx.Value("i", 0)
+
+    with _single_threaded_env():
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=ctx,
+            initializer=_init_batch_worker,
+            initargs=(worker_counter,),
+        ) as executor:
+            return list(executor.map(_calculate_fos_from_config, configs))
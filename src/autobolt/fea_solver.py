@@ -1,195 +1,494 @@
-﻿import tempfile
+﻿from __future__ import annotations
 
-import build123d
-import fenics
-import gmsh
-import meshio
+import atexit
+import logging
+import os
+import tempfile
+import threading
+from typing import TYPE_CHECKING
 
+import numpy as np
 
-def _calculate_fos_from_build123d(
-    build123d_object: build123d.Shape,
-    elastic_modulus: float,
-    poissons_ratio: float,
-    yield_strength: float,
-    traction_values: list[tuple],
-):
-    """
-    Calculate the Factor of Safety (FOS) for a given Build123d object using FEniCS.
+# build123d, dolfinx and gmsh are imported inside the functions that use them,
+# so importing autobolt does not pay their (multi-second) import cost
+if TYPE_CHECKING:
+    import build123d
 
-    Parameters:
-        build123d_object (build123d.Shape): The Build123d object representing the geometry
-        elastic_modulus (float): Young's modulus of the material.
-        poissons_ratio (float): Poisson's ratio of the material.
-        yield_strength (float): Yield strength of the material.
-        traction_values (list[tuple]): List of traction force vectors to apply on specified surfaces.
+logger = logging.getLogger(__name__)
 
-    Returns:
-        float: The calculated Factor of Safety (FOS).
+# A single GMSH session is shared by all calls; initializing it is expensive
+_gmsh_initialized = False
+_gmsh_lock = threading.Lock()
+
+
+def _ensure_gmsh():
     """
+    Initialize the shared GMSH session on first use and finalize it at exit.
 
-    # Make a temporary directory using tempfile
-    tempdir = tempfile.TemporaryDirectory()
+    Must be called with _gmsh_lock held.
+    """
+    global _gmsh_initialized
+    import gmsh
 
-    # Save the step file to the temporary directory
-    step_file = tempdir.name + "/model.step"
-    build123d.export_step(build123d_object, step_file)
+    if not _gmsh_initialized:
+        # -noenv: don't let gmsh modify the process environment (argv[0] is the
+        # program name). interruptible=False: don't take over SIGINT, which gmsh
+        # would only restore at exit, and which fails outside the main thread.
+        gmsh.initialize(["gmsh", "-noenv"], interruptible=False)
+        atexit.register(gmsh.finalize)
+        _gmsh_initialized = True
 
-    msh_file = tempdir.name + "/mesh_merged.msh"
-    xdmf_file_mesh = tempdir.name + "/mesh.xdmf"
-    xdmf_file_surface_tags = tempdir.name + "surface_tags.xdmf"
 
-    # Initialize GMSH
-    gmsh.initialize()
+def _build_rigid_body_nullspace(V):
+    """
+    Build the near-nullspace of 3D linear elasticity (rigid body modes).
 
-    # Import the STEP file
-    gmsh.merge(step_file)
+    Parameters:
+        V (dolfinx.fem.FunctionSpace): The vector function space for displacement.
 
-    # Synchronize CAD kernel
-    gmsh.model.occ.synchronize()
+    Returns:
+        petsc4py.PETSc.NullSpace: Orthonormal basis of three translations and three rotations.
+    """
+    import dolfinx
+    from petsc4py import PETSc
+
+    index_map = V.dofmap.index_map
+    bs = V.dofmap.index_map_bs
+    basis = [
+        dolfinx.la.vector(index_map, bs=bs, dtype=PETSc.ScalarType) for _ in range(6)
+    ]
+    b = [vec.array for vec in basis]
+
+    # Dofs of each displacement component and their coordinates
+    dofs = [V.sub(i).dofmap.list.flatten() for i in range(3)]
+    x = V.tabulate_dof_coordinates()
+    dofs_block = V.dofmap.list.flatten()
+    x0, x1, x2 = x[dofs_block, 0], x[dofs_block, 1], x[dofs_block, 2]
+
+    # Translations
+    for i in range(3):
+        b[i][dofs[i]] = 1.0
+
+    # Rotations
+    b[3][dofs[0]] = -x1
+    b[3][dofs[1]] = x0
+    b[4][dofs[0]] = x2
+    b[4][dofs[2]] = -x0
+    b[5][dofs[2]] = x1
+    b[5][dofs[1]] = -x2
+
+    dolfinx.la.orthonormalize(basis)
+
+    length = bs * index_map.size_local
+    basis_petsc = [
+        PETSc.Vec().createWithArray(vec[:length], bsize=bs, comm=V.mesh.comm)
+        for vec in b
+    ]
+    return PETSc.NullSpace().create(vectors=basis_petsc)
 
-    # Get all volumes and surfaces
-    volumes = gmsh.model.getEntities(dim=3)
-    surfaces = gmsh.model.getEntities(dim=2)
 
-    # Assign physical groups to volumes
-    for i, volume in enumerate(volumes):
-        gmsh.model.addPhysicalGroup(volume[0], [volume[1]], tag=i + 1)
+def _mesh_from_build123d(
+    build123d_object: build123d.Shape,
+    mesh_size: float | None = None,
+    hole_mesh_size: float | None = None,
+):
+    """
+    Mesh a Build123d object with GMSH and convert it to a dolfinx mesh.
 
-    # Assign physical groups to surfaces
-    for i, surface in enumerate(surfaces):
-        gmsh.model.addPhysicalGroup(surface[0], [surface[1]], tag=i + 1)
+    Parameters:
+        build123d_object (build123d.Shape): The Build123d object representing the geometry
+        mesh_size (float, optional): Target element size in meters over the whole model.
+        hole_mesh_size (float, optional): Target element size in meters on cylindrical (hole and bolt) surfaces.
+            Defaults to 1/8 of the smallest hole radius.
 
-    surface_info = []
-    for dim, s in gmsh.model.getEntities(2):
-        bb = gmsh.model.occ.getBoundingBox(dim, s)
-        ymin, ymax = bb[1], bb[4]
-        surface_info.append((s, ymin, ymax))
+    Returns:
+        tuple: The dolfinx mesh, the facet MeshTags of surface tags, the
+        fixed surface tags and the traction surface tags.
+    """
+    import build123d
+    import gmsh
+    from dolfinx.io import gmshio
+    from mpi4py import MPI
 
-    global_ymin = min(s[1] for s in surface_info)
-    global_ymax = max(s[2] for s in surface_info)
+    # Make a temporary directory using tempfile
+    tempdir = tempfile.TemporaryDirectory()
 
-    # Helper function: find the surface tag at a target Y location
-    def y_face(surface_info, target_y, tol=1e-6):
-        return next(
-            tag
-            for tag, ymin, ymax in surface_info
-            if abs(ymax - ymin) < tol and abs(ymin - target_y) < tol
+    # Save the native OCCT BRep to the temporary directory. This is much
+    # smaller and faster to write/parse than a STEP round-trip.
+    brep_file = tempdir.name + "/model.brep"
+    build123d.export_brep(build123d_object, brep_file)
+
+    # GMSH holds global state, so only one model is meshed at a time
+    with _gmsh_lock:
+        # Start a fresh model in the persistent GMSH session
+        _ensure_gmsh()
+        gmsh.clear()
+        gmsh.model.add(f"autobolt_{id(build123d_object)}")
+
+        # Import the BRep file
+        gmsh.merge(brep_file)
+
+        # Synchronize CAD kernel
+        gmsh.model.occ.synchronize()
+
+        # Get all volumes and surfaces
+        volumes = gmsh.model.getEntities(dim=3)
+        surfaces = gmsh.model.getEntities(dim=2)
+
+        # Assign physical groups to volumes
+        for i, volume in enumerate(volumes):
+            gmsh.model.addPhysicalGroup(volume[0], [volume[1]], tag=i + 1)
+
+        # Assign physical groups to surfaces
+        for i, surface in enumerate(surfaces):
+            gmsh.model.addPhysicalGroup(surface[0], [surface[1]], tag=i + 1)
+
+        # Collect surface tags and bounding boxes (xmin, ymin, zmin, xmax, ymax, zmax)
+        surface_tags = np.empty(len(surfaces), dtype=np.int64)
+        surface_bb = np.empty((len(surfaces), 6), dtype=np.float64)
+        for i, (dim, s) in enumerate(surfaces):
+            surface_tags[i] = s
+            surface_bb[i] = gmsh.model.occ.getBoundingBox(dim, s)
+
+        surface_ymin = surface_bb[:, 1]
+        surface_ymax = surface_bb[:, 4]
+        global_ymin = surface_ymin.min()
+        global_ymax = surface_ymax.max()
+
+        # Planar surfaces normal to Y (zero extent in Y)
+        tol = 1e-6
+        y_planar = np.abs(surface_ymax - surface_ymin) < tol
+
+        # Helper function: find the surface tag at a target Y location
+        def y_face(target_y):
+            matches = np.flatnonzero(y_planar & (np.abs(surface_ymin - target_y) < tol))
+            return int(surface_tags[matches[0]])
+
+        # Identify min Y and max Y surfaces
+        trac_pos_tag = y_face(global_ymin)
+        trac_neg_tag = y_face(global_ymax)
+        zero_disp_tags = [trac_pos_tag]
+        traction_tags = [trac_neg_tag]
+
+        gmsh.model.occ.synchronize()
+
+        # Set the global element size
+        if mesh_size is not None:
+            gmsh.model.mesh.setSize(gmsh.model.getEntities(0), mesh_size)
+
+        # Refine around the holes, which are the only stress concentrators
+        hole_surfaces = [
+            (dim, s) for dim, s in surfaces if gmsh.model.getType(dim, s) == "Cylinder"
+        ]
+        if hole_surfaces:
+            if hole_mesh_size is None:
+                # An axis-aligned cylinder's bounding box has extents
+                # (2r, 2r, height), so the median extent is its diameter
+                hole_bb = np.array(
+                    [gmsh.model.occ.getBoundingBox(dim, s) for dim, s in hole_surfaces]
+                )
+                hole_radius = np.median(hole_bb[:, 3:] - hole_bb[:, :3], axis=1) / 2
+                hole_mesh_size = hole_radius.min() / 8
+
+            hole_points = gmsh.model.getBoundary(
+                hole_surfaces, combined=False, oriented=False, recursive=True
+            )
+            gmsh.model.mesh.setSize(hole_points, hole_mesh_size)
+
+        # Use the parallel HXT tetrahedralizer. 0 threads means "system default",
+        # i.e. OMP_NUM_THREADS, so batch workers stay single-threaded.
+        gmsh.option.setNumber("Mesh.Algorithm3D", 10)
+        gmsh.option.setNumber("General.NumThreads", 0)
+
+        # Generate the mesh
+        gmsh.model.mesh.generate(3)
+
+        gmsh.model.mesh.removeDuplicateNodes()
+
+        # Build the dolfinx mesh and surface tags directly from the live gmsh
+        # model (cells and facets are taken from the physical groups)
+        mesh, _, facet_tags = gmshio.model_to_mesh(
+            gmsh.model, MPI.COMM_SELF, 0, gdim=3
         )
 
-    # Identify min Y and max Y surfaces
-    trac_pos_tag = y_face(surface_info, global_ymin)
-    trac_neg_tag = y_face(surface_info, global_ymax)
-    zero_disp_tags = [trac_pos_tag]
-    traction_tags = [trac_neg_tag]
+        # Release the model but keep the session alive for the next call
+        gmsh.clear()
 
-    gmsh.model.occ.synchronize()
+    return mesh, facet_tags, zero_disp_tags, traction_tags
 
-    # Generate the mesh
-    gmsh.model.mesh.generate(3)
 
-    gmsh.model.mesh.removeDuplicateNodes()
+class BoltAssemblyFEA:
+    """
+    Linear elastic FEA model of a Build123d assembly.
 
-    # Save the mesh to a .msh file
-    gmsh.write(msh_file)
+    The geometry is meshed and the stiffness matrix and AMG preconditioner are
+    set up once on construction. Each call to solve() only reassembles the
+    load vector and reuses the operator, so sweeping over traction values does
+    not re-mesh or re-factorize.
 
-    # Finalize GMSH
-    gmsh.finalize()
+    The .pvd debug output is only complete once close() has been called; use
+    the object as a context manager to do this automatically.
 
-    # Read the .msh file using meshio
-    msh = meshio.read(msh_file)
+    Parameters:
+        build123d_object (build123d.Shape): The Build123d object representing the geometry
+        elastic_modulus (float): Young's modulus of the material.
+        poissons_ratio (float): Poisson's ratio of the material.
+        yield_strength (float): Yield strength of the material.
+        element_order (int): Polynomial order of the Lagrange elements (1 or 2).
+        mesh_size (float, optional): Target element size in meters over the whole model.
+        hole_mesh_size (float, optional): Target element size in meters on cylindrical (hole and bolt) surfaces.
+            Defaults to 1/8 of the smallest hole radius.
+        solver_tolerance (float): Relative residual tolerance of the iterative solver.
+        debug_output (bool): Write displacement.pvd and stress.pvd, with each solve()
+            as one time step (0, 1, 2, ...) of the same files.
+        debug_dir (str, optional): Directory for the debug output; implies debug_output.
+            Defaults to a new temporary directory whose path is logged. Either way
+            it is available as the debug_dir attribute.
+    """
 
-    # Utility function to extract specific cell types
-    def create_mesh(mesh, cell_type, prune_z=False):
-        cells = mesh.get_cells_type(cell_type)
-        cell_data = mesh.get_cell_data("gmsh:physical", cell_type)
-        points = mesh.points[:, :2] if prune_z else mesh.points
-        out_mesh = meshio.Mesh(
-            points=points,
-            cells={cell_type: cells},
-            cell_data={"name_to_read": [cell_data]},
+    def __init__(
+        self,
+        build123d_object: build123d.Shape,
+        elastic_modulus: float,
+        poissons_ratio: float,
+        yield_strength: float,
+        element_order: int = 1,
+        mesh_size: float | None = None,
+        hole_mesh_size: float | None = None,
+        solver_tolerance: float = 1e-6,
+        debug_output: bool = False,
+        debug_dir: str | None = None,
+    ):
+        import dolfinx
+        import dolfinx.fem.petsc
+        import ufl
+        from dolfinx.io import VTKFile
+        from petsc4py import PETSc
+
+        if element_order not in (1, 2):
+            raise ValueError(f"element_order must be 1 or 2, got {element_order!r}")
+
+        self.yield_strength = yield_strength
+
+        # Debug fields go to a directory that outlives this object so they can
+        # be inspected after the run
+        if debug_dir is not None:
+            os.makedirs(debug_dir, exist_ok=True)
+        elif debug_output:
+            debug_dir = tempfile.mkdtemp(prefix="autobolt_debug_")
+            logger.info("Writing FEA debug output to %s", debug_dir)
+        self.debug_dir = debug_dir
+
+        mesh, facet_tags, zero_disp_tags, traction_tags = _mesh_from_build123d(
+            build123d_object, mesh_size=mesh_size, hole_mesh_size=hole_mesh_size
         )
-        return out_mesh
-
-    # Write the volumetric mesh (tetrahedrons) to mesh.xdmf
-    tetra_mesh = create_mesh(msh, "tetra")
-    meshio.write(xdmf_file_mesh, tetra_mesh)
-
-    # Write the surface tags (triangles) to surface_tags.xdmf
-    triangle_mesh = create_mesh(msh, "triangle")
-    meshio.write(xdmf_file_surface_tags, triangle_mesh)
-
-    # Step 2: FEniCS Simulation
-    mesh = fenics.cpp.mesh.Mesh()
-    with fenics.cpp.io.XDMFFile(xdmf_file_mesh) as infile:
-        infile.read(mesh)
-
-    # Load the surface tags in FEniCS
-    mvc = fenics.MeshValueCollection("size_t", mesh, 2)
-    with fenics.cpp.io.XDMFFile(xdmf_file_surface_tags) as infile:
-        infile.read(mvc, "name_to_read")
-    mf = fenics.cpp.mesh.MeshFunctionSizet(mesh, mvc)
-
-    # Define function space for displacement
-    V = fenics.VectorFunctionSpace(mesh, "CG", 2)
-    W = fenics.FunctionSpace(mesh, "CG", 2)
-
-    # Define boundary conditions
-    bcs = [
-        fenics.DirichletBC(V, fenics.Constant((0.0, 0.0, 0.0)), mf, tag)
-        for tag in zero_disp_tags
-    ]
-
-    # Define material properties
-    mu = elastic_modulus / (2.0 * (1.0 + poissons_ratio))  # Shear modulus
-    lmbda = (
-        elastic_modulus
-        * poissons_ratio
-        / ((1.0 + poissons_ratio) * (1.0 - 2.0 * poissons_ratio))
-    )  # First Lamé parameter
-
-    # Define strain and stress
-    def epsilon(u):
-        return 0.5 * (fenics.grad(u) + fenics.grad(u).T)
-
-    def sigma(u):
-        return 2.0 * mu * epsilon(u) + lmbda * fenics.tr(epsilon(u)) * fenics.Identity(
-            3
+        self.mesh = mesh
+
+        # Keep the debug files open so that each solve() adds a time step
+        # instead of overwriting the previous load case
+        self._n_solves = 0
+        self._displacement_file = None
+        self._stress_file = None
+        if self.debug_dir is not None:
+            self._displacement_file = VTKFile(
+                mesh.comm, self.debug_dir + "/displacement.pvd", "w"
+            )
+            self._stress_file = VTKFile(mesh.comm, self.debug_dir + "/stress.pvd", "w")
+
+        # Define function space for displacement
+        V = dolfinx.fem.functionspace(mesh, ("Lagrange", element_order, (3,)))
+
+        # Define boundary conditions
+        fdim = mesh.topology.dim - 1
+        zero = np.zeros(3, dtype=PETSc.ScalarType)
+        bcs = [
+            dolfinx.fem.dirichletbc(
+                zero,
+                dolfinx.fem.locate_dofs_topological(V, fdim, facet_tags.find(tag)),
+                V,
+            )
+            for tag in zero_disp_tags
+        ]
+
+        # Define material properties
+        mu = elastic_modulus / (2.0 * (1.0 + poissons_ratio))  # Shear modulus
+        lmbda = (
+            elastic_modulus
+            * poissons_ratio
+            / ((1.0 + poissons_ratio) * (1.0 - 2.0 * poissons_ratio))
+        )  # First Lamé parameter
+
+        # Define strain and stress
+        def epsilon(u):
+            return ufl.sym(ufl.grad(u))
+
+        def sigma(u):
+            return 2.0 * mu * epsilon(u) + lmbda * ufl.tr(epsilon(u)) * ufl.Identity(3)
+
+        # Define variational problem
+        u = ufl.TrialFunction(V)
+        v = ufl.TestFunction(V)
+        f = dolfinx.fem.Constant(mesh, zero)  # Body force (assumed zero)
+
+        # Weak form
+        a = ufl.inner(sigma(u), epsilon(v)) * ufl.dx
+        ds = ufl.Measure("ds", domain=mesh, subdomain_data=facet_tags)
+        L = ufl.dot(f, v) * ufl.dx  # Start with body force term
+
+        # Add traction forces for each specified surface. The tractions are
+        # Constants so that solve() can update them without recompiling L.
+        self._tractions = [dolfinx.fem.Constant(mesh, zero) for _ in traction_tags]
+        for tag, traction in zip(traction_tags, self._tractions):
+            L += ufl.dot(traction, v) * ds(tag)
+
+        # Compile the forms (FFCx JIT) and assemble the stiffness matrix once
+        self._a = dolfinx.fem.form(a)
+        self._L = dolfinx.fem.form(L)
+        self._bcs = bcs
+        A = dolfinx.fem.petsc.assemble_matrix(self._a, bcs=bcs)
+        A.assemble()
+        self._b = dolfinx.fem.petsc.create_vector(self._L)
+
+        # Set up CG preconditioned by smoothed-aggregation AMG, which uses the
+        # rigid body modes to build its coarse spaces. The FoS is only needed to
+        # a few significant figures, so the default tolerance is loose.
+        A.setNearNullSpace(_build_rigid_body_nullspace(V))
+        self.u = dolfinx.fem.Function(V)
+
+        self._solver = PETSc.KSP().create(mesh.comm)
+        self._solver.setOperators(A)
+        self._solver.setType("cg")
+        self._solver.getPC().setType("gamg")
+        self._solver.setTolerances(rtol=solver_tolerance)
+
+        # Von Mises stress is discontinuous across cells, so it is interpolated
+        # cell by cell into DG without any global solve. For P1 the stress is
+        # constant per cell and DG0 is exact; for P2 von Mises is the square
+        # root of a quadratic, so the DG1 interpolant (and its peak) is only
+        # approximate.
+        W = dolfinx.fem.functionspace(mesh, ("DG", element_order - 1))
+        s = sigma(self.u) - (1.0 / 3) * ufl.tr(sigma(self.u)) * ufl.Identity(3)
+        von_Mises = ufl.sqrt(3.0 / 2.0 * ufl.inner(s, s))
+
+        self.von_Mises = dolfinx.fem.Function(W)
+        self._von_Mises_expr = dolfinx.fem.Expression(
+            von_Mises, W.element.interpolation_points()
         )
 
-    # Define variational problem
-    u = fenics.TrialFunction(V)
-    v = fenics.TestFunction(V)
-    f = fenics.Constant((0.0, 0.0, 0.0))  # Body force (assumed zero)
-
-    # Weak form
-    a = fenics.inner(sigma(u), epsilon(v)) * fenics.dx
-    ds = fenics.Measure("ds", domain=mesh, subdomain_data=mf)
-    L = fenics.dot(f, v) * fenics.dx  # Start with body force term
-
-    # Add traction forces for each specified surface
-    for tag, traction in zip(traction_tags, traction_values):
-        L += fenics.dot(fenics.Constant(traction), v) * ds(tag)
-
-    # Solve the problem
-    u = fenics.Function(V)
-    fenics.solve(a == L, u, bcs)
-
-    pvd_file_solution = "../../displacement.pvd"
-    fenics.cpp.io.File(pvd_file_solution) << u
-
-    # Compute von Mises stress
-    s = sigma(u) - (1.0 / 3) * fenics.tr(sigma(u)) * fenics.Identity(3)
-    von_Mises = fenics.project(
-        fenics.sqrt(3.0 / 2.0 * fenics.inner(s, s)), W, solver_type="cg"
-    )
+    def solve(self, traction_values: list[tuple]) -> float:
+        """
+        Solve for one load case, reusing the assembled operator.
+
+        Parameters:
+            traction_values (list[tuple]): List of traction force vectors to apply on specified surfaces.
+
+        Returns:
+            float: The calculated Factor of Safety (FOS).
+        """
+        import dolfinx.fem.petsc
+        from petsc4py import PETSc
+
+        # Update the tractions and assemble only the load vector. Surfaces
+        # without a traction value are unloaded, not left at the previous case.
+        for traction in self._tractions:
+            traction.value[:] = 0.0
+        for traction, value in zip(self._tractions, traction_values):
+            traction.value[:] = value
+        b = self._b
+        with b.localForm() as b_local:
+            b_local.set(0.0)
+        dolfinx.fem.petsc.assemble_vector(b, self._L)
+        dolfinx.fem.petsc.apply_lifting(b, [self._a], bcs=[self._bcs])
+        b.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
+        dolfinx.fem.petsc.set_bc(b, self._bcs)
+
+        # Solve the problem
+        u = self.u
+        self._solver.solve(b, u.x.petsc_vec)
+        u.x.scatter_forward()
+
+        if self._displacement_file is not None:
+            self._displacement_file.write_function(u, self._n_solves)
+
+        # Compute von Mises stress (cell-local interpolation)
+        von_Mises = self.von_Mises
+        von_Mises.interpolate(self._von_Mises_expr)
+
+        if self._stress_file is not None:
+            self._stress_file.write_function(von_Mises, self._n_solves)
+        self._n_solves += 1
+
+        # Compute maximum von Mises stress directly on the local DG dof array
+        # (one value per cell for P1)
+        max_stress = float(np.max(von_Mises.x.array))
+
+        # Compute Factor of Safety (FOS); an unloaded assembly never yields
+        FOS = self.yield_strength / max_stress if max_stress > 0 else float("inf")
+
+        return FOS
+
+    def close(self):
+        """
+        Close the debug output files, which writes their .pvd collection index.
+
+        No further debug output is written after this; calling it again is a no-op.
+        """
+        for vtk in (self._displacement_file, self._stress_file):
+            if vtk is not None:
+                vtk.close()
+        self._displacement_file = None
+        self._stress_file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
-    pvd_file_solution = "../../stress.pvd"
-    fenics.cpp.io.File(pvd_file_solution) << von_Mises
 
-    # Compute maximum von Mises stress
-    max_stress = von_Mises.vector().max()
+def _calculate_fos_from_build123d(
+    build123d_object: build123d.Shape,
+    elastic_modulus: float,
+    poissons_ratio: float,
+    yield_strength: float,
+    traction_values: list[tuple],
+    element_order: int = 1,
+    mesh_size: float | None = None,
+    hole_mesh_size: float | None = None,
+    solver_tolerance: float = 1e-6,
+    debug_output: bool = False,
+    debug_dir: str | None = None,
+):
+    """
+    Calculate the Factor of Safety (FOS) for a given Build123d object using FEniCSx.
 
-    # Compute Factor of Safety (FOS)
-    FOS = yield_strength / max_stress
+    Parameters:
+        build123d_object (build123d.Shape): The Build123d object representing the geometry
+        elastic_modulus (float): Young's modulus of the material.
+        poissons_ratio (float): Poisson's ratio of the material.
+        yield_strength (float): Yield strength of the material.
+        traction_values (list[tuple]): List of traction force vectors to apply on specified surfaces.
+        element_order (int): Polynomial order of the Lagrange elements (1 or 2).
+        mesh_size (float, optional): Target element size in meters over the whole model.
+        hole_mesh_size (float, optional): Target element size in meters on cylindrical (hole and bolt) surfaces.
+            Defaults to 1/8 of the smallest hole radius.
+        solver_tolerance (float): Relative residual tolerance of the iterative solver.
+        debug_output (bool): Write displacement.pvd and stress.pvd to a new temporary directory.
+        debug_dir (str, optional): Directory for the debug output; implies debug_output.
 
-    return FOS
+    Returns:
+        float: The calculated Factor of Safety (FOS).
+    """
+    with BoltAssemblyFEA(
+        build123d_object,
+        elastic_modulus=elastic_modulus,
+        poissons_ratio=poissons_ratio,
+        yield_strength=yield_strength,
+        element_order=element_order,
+        mesh_size=mesh_size,
+        hole_mesh_size=hole_mesh_size,
+        solver_tolerance=solver_tolerance,
+        debug_output=debug_output,
+        debug_dir=debug_dir,
+    ) as fea:
+        return fea.solve(traction_values)
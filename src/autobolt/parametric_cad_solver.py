@@ -1,4 +1,4 @@
-﻿import build123d
+﻿import numpy as np
 
 
 def create_two_plate_assembly(
@@ -30,6 +30,8 @@ def create_two_plate_assembly(
         build123d.Compound: The assembled two-plate structure with bolt-like cylinders.
 
     """
+    import build123d
+
     # convert the gap to meters
     gap_m = plate_gap_mm * 1e-4
 
@@ -41,19 +43,22 @@ def create_two_plate_assembly(
 
         # compute X‑coordinates of hole centers
         x0 = plate_length_m - edge_margin_m
-        x_coords = [x0 - i * hole_spacing_m for i in range(num_holes)]
+        x_coords = (x0 - np.arange(num_holes) * hole_spacing_m).tolist()
 
-        # subtract each hole
-        for x in x_coords:
-            with build123d.Locations(build123d.Pos(x, hole_offset_from_bottom_m, 0)):
-                build123d.Cylinder(
-                    radius=hole_radius_m,
-                    height=plate_thickness_m + 1e-3,  # +1 mm to ensure clean cut
-                    mode=build123d.Mode.SUBTRACT,
-                )
+        # subtract all holes in a single boolean operation
+        with build123d.Locations(
+            *[build123d.Pos(x, hole_offset_from_bottom_m, 0) for x in x_coords]
+        ):
+            build123d.Cylinder(
+                radius=hole_radius_m,
+                height=plate_thickness_m + 1e-3,  # +1 mm to ensure clean cut
+                mode=build123d.Mode.SUBTRACT,
+            )
     plateA = bp.part
 
     # 2) Copy Plate A → shift up by thickness+gap → mirror in Y → re‑position
+    # (a shallow, geometry-sharing copy is enough: locate/mirror only change
+    # placement, and deep-copying would clone every OCCT sub-shape)
     plateB = build123d.copy(plateA)
     # shift in Z by plate_thickness + gap
     plateB = plateB.locate(
@@ -71,19 +76,18 @@ def create_two_plate_assembly(
     z_offset_m = plate_thickness_m / 2 + gap_m / 2  # start mid‑thickness of Plate A
 
     with build123d.BuildPart() as bp2:
-        for x in x_coords:
-            with build123d.Locations(
-                build123d.Pos(x, hole_offset_from_bottom_m, z_offset_m)
-            ):
-                build123d.Cylinder(
-                    radius=hole_radius_m,
-                    height=bolt_height_m,
-                    align=(
-                        build123d.Align.CENTER,
-                        build123d.Align.CENTER,
-                        build123d.Align.CENTER,
-                    ),
-                )
+        with build123d.Locations(
+            *[build123d.Pos(x, hole_offset_from_bottom_m, z_offset_m) for x in x_coords]
+        ):
+            build123d.Cylinder(
+                radius=hole_radius_m,
+                height=bolt_height_m,
+                align=(
+                    build123d.Align.CENTER,
+                    build123d.Align.CENTER,
+                    build123d.Align.CENTER,
+                ),
+            )
     bolt_cylinders = bp2.part
 
     # 4) Assemble and return
@@ -1,20 +1,38 @@
+import os
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+
 import autobolt
+import autobolt.combined
+
+# Example plate geometry shared by the tests
+EXAMPLE_GEOMETRY = dict(
+    plate_length_m=0.200,  # [m] length of each plate (along X)
+    plate_width_m=0.100,  # [m] width of each plate (along Y)
+    plate_thickness_m=0.010,  # [m] thickness of each plate (along Z)
+    num_holes=4,  # number of bolt holes per plate
+    hole_radius_m=0.010,  # [m] radius of bolt/hole
+    edge_margin_m=0.05387,  # [m]distance from right plate edge to first hole center
+    hole_spacing_m=0.035,  # [m] spacing between consecutive holes (X direction)
+    hole_offset_from_bottom_m=0.020,  # [m] vertical position of hole centers (Y from bottom edge)
+    plate_gap_mm=0.01,  # [mm] gap between the two plates
+)
+
+# Full calculate_fos arguments: example geometry, steel, one load case
+EXAMPLE_CONFIG = dict(
+    **EXAMPLE_GEOMETRY,
+    elastic_modulus=210e9,  # [Pa] Young's modulus for steel
+    poissons_ratio=0.3,  # Poisson's ratio for steel
+    yield_strength=200e6,  # [Pa] Yield strength for steel
+    traction_values=[(0, -1e6, 0)],  # [Pa] Applied
+)
 
 
 def test_two_function_workflow():
 
     # Example usage:
-    assembly = autobolt.create_two_plate_assembly(
-        plate_length_m=0.200,  # [m] length of each plate (along X)
-        plate_width_m=0.100,  # [m] width of each plate (along Y)
-        plate_thickness_m=0.010,  # [m] thickness of each plate (along Z)
-        num_holes=4,  # number of bolt holes per plate
-        hole_radius_m=0.010,  # [m] radius of bolt/hole
-        edge_margin_m=0.05387,  # [m]distance from right plate edge to first hole center
-        hole_spacing_m=0.035,  # [m] spacing between consecutive holes (X direction)
-        hole_offset_from_bottom_m=0.020,  # [m] vertical position of hole centers (Y from bottom edge)
-        plate_gap_mm=0.01,  # [mm] gap between the two plates
-    )
+    assembly = autobolt.create_two_plate_assembly(**EXAMPLE_GEOMETRY)
 
     print(assembly)
 
@@ -32,20 +50,109 @@ def test_two_function_workflow():
 def test_one_function_workflow():
 
     # Example usage:
-    fos = autobolt.calculate_fos(
-        plate_length_m=0.200,  # [m] length of each plate (along X)
-        plate_width_m=0.100,  # [m] width of each plate (along Y)
-        plate_thickness_m=0.010,  # [m] thickness of each plate (along Z)
-        num_holes=4,  # number of bolt holes per plate
-        hole_radius_m=0.010,  # [m] radius of bolt/hole
-        edge_margin_m=0.05387,  # [m]distance from right plate edge to first hole center
-        hole_spacing_m=0.035,  # [m] spacing between consecutive holes (X direction)
-        hole_offset_from_bottom_m=0.020,  # [m] vertical position of hole centers (Y from bottom edge)
-        plate_gap_mm=0.01,  # [mm] gap between the two plates
+    fos = autobolt.calculate_fos(**EXAMPLE_CONFIG)
+    print(f"Calculated Factor of Safety: {fos}")
+    assert fos > 0, "Factor of Safety should be positive"
+
+
+def test_assembly_cache_reuses_geometry():
+
+    geometry = (0.300, 0.100, 0.010, 4, 0.010, 0.05387, 0.035, 0.020, 0.01)
+    noisy_geometry = (0.1 * 3, *geometry[1:])  # 0.30000000000000004
+    other_geometry = (0.250, *geometry[1:])
+    assert noisy_geometry != geometry
+
+    first = autobolt.combined._cached_two_plate_assembly(
+        *autobolt.combined._geometry_key(*geometry)
+    )
+    second = autobolt.combined._cached_two_plate_assembly(
+        *autobolt.combined._geometry_key(*noisy_geometry)
+    )
+    third = autobolt.combined._cached_two_plate_assembly(
+        *autobolt.combined._geometry_key(*other_geometry)
+    )
+    assert first is second, "Geometry differing by float noise should hit the cache"
+    assert first is not third, "Different geometry should build a new assembly"
+
+
+def test_traction_sweep_workflow():
+
+    sweep_config = {k: v for k, v in EXAMPLE_CONFIG.items() if k != "traction_values"}
+
+    fos_values = autobolt.calculate_fos_sweep(
+        **sweep_config,
+        traction_cases=[[(0, -1e6, 0)], [(0, -2e6, 0)]],  # [Pa] Applied
+    )
+    print(f"Calculated Factors of Safety: {fos_values}")
+    assert all(fos > 0 for fos in fos_values), "Factor of Safety should be positive"
+    # Linear elasticity: doubling the load halves the factor of safety
+    assert abs(fos_values[0] / fos_values[1] - 2.0) < 1e-3
+
+
+def test_batch_workflow():
+
+    configs = [EXAMPLE_CONFIG, {**EXAMPLE_CONFIG, "num_holes": 3}]
+
+    fos_values = autobolt.calculate_fos_batch(configs, n_workers=2)
+    print(f"Calculated Factors of Safety: {fos_values}")
+    assert len(fos_values) == len(configs)
+    assert all(fos > 0 for fos in fos_values), "Factor of Safety should be positive"
+
+    # Results come back in input order: each batch result matches the serial
+    # run of its own configuration more closely than that of the other one
+    serial_values = [autobolt.calculate_fos(**config) for config in configs]
+    for i, fos in enumerate(fos_values):
+        errors = [abs(fos - serial) for serial in serial_values]
+        assert errors.index(min(errors)) == i
+        assert abs(fos - serial_values[i]) <= 0.05 * serial_values[i]
+
+
+def test_debug_output_keeps_every_solve():
+
+    assembly = autobolt.create_two_plate_assembly(**EXAMPLE_GEOMETRY)
+
+    with autobolt.BoltAssemblyFEA(
+        assembly,
         elastic_modulus=210e9,  # [Pa] Young's modulus for steel
         poissons_ratio=0.3,  # Poisson's ratio for steel
         yield_strength=200e6,  # [Pa] Yield strength for steel
-        traction_values=[(0, -1e6, 0)],  # [Pa] Applied
+        debug_output=True,
+    ) as fea:
+        fea.solve([(0, -1e6, 0)])
+        fea.solve([(0, -2e6, 0)])
+
+    # Both load cases are time steps of each .pvd collection
+    for name in ("displacement.pvd", "stress.pvd"):
+        datasets = ET.parse(f"{fea.debug_dir}/{name}").getroot().iter("DataSet")
+        timesteps = sorted(float(d.get("timestep")) for d in datasets)
+        assert timesteps == [0.0, 1.0], f"{name} should hold one step per solve"
+
+
+def test_traction_sweep_resets_missing_tractions():
+
+    sweep_config = {k: v for k, v in EXAMPLE_CONFIG.items() if k != "traction_values"}
+
+    fos_values = autobolt.calculate_fos_sweep(
+        **sweep_config,
+        traction_cases=[[(0, -1e6, 0)], [], [(0, -1e6, 0)]],  # [Pa] Applied
     )
-    print(f"Calculated Factor of Safety: {fos}")
-    assert fos > 0, "Factor of Safety should be positive"
+    print(f"Calculated Factors of Safety: {fos_values}")
+    # An empty case means no load, not the previous case's load
+    assert fos_values[1] == float("inf"), "Unloaded assembly should never yield"
+    assert abs(fos_values[2] / fos_values[0] - 1.0) < 1e-3
+
+
+def test_import_is_lightweight():
+
+    # Import in a fresh interpreter, since this test process already has the
+    # heavy dependencies loaded
+    code = (
+        "import sys, autobolt; "
+        "print(','.join(m for m in ('gmsh', 'dolfinx', 'build123d') if m in sys.modules))"
+    )
+    src_dir = os.path.dirname(os.path.dirname(autobolt.__file__))
+    env = {**os.environ, "PYTHONPATH": src_dir}
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+    assert result.stdout.strip() == "", f"import autobolt loaded {result.stdout.strip()}"